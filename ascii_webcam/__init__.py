@@ -2,7 +2,24 @@
 
 __version__ = "0.1.0"
 
-from .app import ASCIIWebcam
-from .converter import ASCIIConverter
+__all__ = ['ASCIIWebcam', 'ASCIIConverter']
 
-__all__ = ['ASCIIWebcam', 'ASCIIConverter'] 
\ No newline at end of file
+# The classes are imported on first access, so that importing one submodule
+# (or running ``python -m ascii_webcam.app``) does not load the other
+_EXPORTS = {
+    'ASCIIWebcam': '.app',
+    'ASCIIConverter': '.converter',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,97 @@
+"""Optional Numba-compiled kernels for the ASCII conversion hot path.
+
+Numba is an optional dependency (``pip install ascii-webcam[fast]``). When it
+is not installed ``build_ansi`` is ``None`` and the converter falls back to
+its vectorized NumPy implementation.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+
+def _build_ansi(values, intensity, escape, digits, digit_lengths, char_bytes, char_lengths,
+                row_end, out):
+    """Write one frame of colored ASCII art into a byte buffer.
+
+    A color escape is only written where the color fields differ from the
+    previous cell in the row, and decimal values are written without
+    leading zeros.
+
+    Args:
+        values: (H, W, N) uint8 color fields per cell (RGB or palette index)
+        intensity: (H, W) uint8 grayscale values selecting the characters
+        escape: uint8 escape prefix written before the color fields
+        digits: (256, 3) uint8 left-aligned decimal digits of every value
+        digit_lengths: (256,) uint8 number of digits of every value
+        char_bytes: (256, K) uint8 UTF-8 bytes of the character per intensity
+        char_lengths: (256,) uint8 number of used bytes in each char_bytes row
+        row_end: uint8 bytes terminating every row, ending in a newline
+        out: uint8 output buffer large enough for the worst case
+
+    Returns:
+        Number of bytes written, excluding the newline after the last row
+    """
+    height, width, num_fields = values.shape
+    pos = 0
+    for y in range(height):
+        for x in range(width):
+            changed = x == 0
+            if not changed:
+                for f in range(num_fields):
+                    if values[y, x, f] != values[y, x - 1, f]:
+                        changed = True
+                        break
+
+            if changed:
+                for i in range(escape.size):
+                    out[pos] = escape[i]
+                    pos += 1
+                for f in range(num_fields):
+                    # Copy all three digit slots without branching, then put
+                    # the terminator right after the used ones
+                    value = values[y, x, f]
+                    out[pos] = digits[value, 0]
+                    out[pos + 1] = digits[value, 1]
+                    out[pos + 2] = digits[value, 2]
+                    pos += digit_lengths[value]
+                    # Fields are separated by ';' and the last one ends in 'm'
+                    out[pos] = 109 if f == num_fields - 1 else 59
+                    pos += 1
+
+            level = intensity[y, x]
+            for i in range(char_lengths[level]):
+                out[pos] = char_bytes[level, i]
+                pos += 1
+
+        for i in range(row_end.size):
+            out[pos] = row_end[i]
+            pos += 1
+
+    return pos - 1
+
+
+if njit is not None:
+    build_ansi = njit(cache=True, nogil=True)(_build_ansi)
+
+    # Compile once at import so the JIT does not stall the first frame, both
+    # for palette indices and for reversed (BGR read as RGB) color views
+    for _values in (np.zeros((1, 1, 1), dtype=np.uint8),
+                    np.zeros((1, 1, 3), dtype=np.uint8)[..., ::-1]):
+        build_ansi(
+            _values,
+            np.zeros((1, 1), dtype=np.uint8),
+            np.frombuffer(b"\033[38;2;", dtype=np.uint8),
+            np.zeros((256, 3), dtype=np.uint8),
+            np.ones(256, dtype=np.uint8),
+            np.zeros((256, 1), dtype=np.uint8),
+            np.ones(256, dtype=np.uint8),
+            np.frombuffer(b"\033[0m\n", dtype=np.uint8),
+            np.empty(64, dtype=np.uint8),
+        )
+    del _values
+else:  # pragma: no cover - depends on the environment
+    build_ansi = None
@@ -2,12 +2,14 @@
 
 import cv2
 import click
+import os
 import sys
 import termios
 import tty
 import select
 import shutil
 import signal
+import threading
 import time
 import psutil
 from typing import Dict, Tuple, Optional
@@ -42,37 +44,89 @@ class ASCIIWebcam:
         'q': 'Quit',
     }
     
-    def __init__(self, camera_id: int = 0, preset: str = 'classic', color_scheme: str = 'true'):
+    # Bytes per screen line beyond the converted frame: a line number prefix
+    # plus the clear-to-end and next-line escapes
+    LINE_OVERHEAD = 24
+    
+    # Clear to the end of the line, then move the cursor to the next line
+    _NEXT_LINE = b"\033[K\033[1E"
+    
+    # Camera pixels requested per character along the width; resizing averages
+    # over them
+    CAPTURE_SUPERSAMPLE = 4
+    
+    # Seconds to wait for the capture thread to deliver a new frame
+    CAPTURE_TIMEOUT = 1.0
+    
+    # Seconds between CPU and memory usage samples
+    STATS_INTERVAL = 1.0
+    
+    # Seconds between refreshes of the figures on the status line
+    STATUS_INTERVAL = 0.5
+    
+    def __init__(self, camera_id: int = 0, preset: str = 'classic', color_scheme: str = 'true',
+                 palette: str = 'truecolor', noise_threshold: int = 0):
         """Initialize the ASCII Webcam viewer.
         
         Args:
             camera_id: ID of the webcam to use (default: 0)
             preset: Character preset to use (default: 'classic')
             color_scheme: Color scheme to use (default: 'true')
+            palette: Terminal color palette to use (default: 'truecolor')
+            noise_threshold: Largest per-channel change between frames that is
+                ignored as camera noise (default: 0, only identical frames)
         
         Raises:
-            ValueError: If preset or color scheme is invalid
+            ValueError: If preset, color scheme, palette or noise threshold is invalid
         """
         if preset not in ASCIIConverter.CHAR_PRESETS:
             raise ValueError(f"Invalid preset '{preset}'. Available presets: {list(ASCIIConverter.CHAR_PRESETS.keys())}")
         if color_scheme not in ASCIIConverter.COLOR_SCHEMES:
             raise ValueError(f"Invalid color scheme '{color_scheme}'. Available schemes: {list(ASCIIConverter.COLOR_SCHEMES.keys())}")
+        if palette not in ASCIIConverter.PALETTES:
+            raise ValueError(f"Invalid palette '{palette}'. Available palettes: {list(ASCIIConverter.PALETTES.keys())}")
+        if not 0 <= noise_threshold <= 255:
+            raise ValueError(f"Invalid noise threshold {noise_threshold}. Must be between 0 and 255")
         
         self.camera_id = camera_id
         self.cap: Optional[cv2.VideoCapture] = None
         self.preset = preset
         self.color_scheme = color_scheme
+        self.palette = palette
+        self.noise_threshold = noise_threshold
         self.show_status = True
         self.show_help = True  # Show help by default
         self.frame_num = 0
         self.frame_rate = 15.0  # Default to 15 FPS
         self.error_message: Optional[str] = None
         self._needs_resize = False  # Flag for resize handling
+        self._output_buffer: Optional[bytearray] = None  # Reused across frames
+        self._output_view: Optional[memoryview] = None
+        self._controls_text = " | ".join(f"{k}: {v}" for k, v in self.CONTROLS.items())
+        self._status_bytes = b""  # Last status line and what it was built for
+        self._status_key: Optional[tuple] = None
+        self._status_time = 0.0
+        
+        # Frame and status line on screen, to skip rewriting an unchanged screen
+        self._drawn_frame: Optional[bytes] = None
+        self._drawn_status: Optional[bytes] = None
+        
+        # Background capture into a single-slot frame buffer
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_stop: Optional[threading.Event] = None  # Owned by that thread
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._latest_frame: Optional[np.ndarray] = None
+        self._capture_error: Optional[str] = None
         
         # Performance monitoring
         self.process = psutil.Process()
-        self.frame_times = np.zeros(30)  # Rolling window of frame times
+        self.process.cpu_percent()  # The first call only starts the measurement
+        self._last_stats_time = 0.0
+        self.frame_times = [0.0] * 30  # Rolling window of frame times
         self.frame_time_idx = 0
+        self._ft_sum = 0.0  # Running sum and count of the recorded frame times
+        self._ft_count = 0
         self.last_frame_time = 0
         self.cpu_usage = 0.0
         self.memory_usage = 0.0
@@ -121,20 +175,43 @@ class ASCIIWebcam:
         # Subtract 2 for status bar (if enabled) and ensure minimum height
         effective_height = max(height - 2, 10) if self.show_status else max(height - 1, 10)
         
-        return ASCIIConverter(
+        converter = ASCIIConverter(
             preset=self.preset,
             width=effective_width,
             height=effective_height,
-            color_scheme=self.color_scheme
+            color_scheme=self.color_scheme,
+            palette=self.palette,
+            noise_threshold=self.noise_threshold
         )
+        
+        # Size the screen buffer for the worst case: a full frame, per-line
+        # escapes and a status line of multi-byte characters
+        buffer_size = (converter.max_output_bytes(effective_width, effective_height)
+                       + height * self.LINE_OVERHEAD + 4 * width)
+        if self._output_buffer is None or len(self._output_buffer) < buffer_size:
+            self._output_buffer = bytearray(buffer_size)
+            self._output_view = memoryview(self._output_buffer)
+        
+        # Pre-encode the per-line pieces of the screen. Each line break also
+        # carries the line number prefix of the line that follows it.
+        prefixes = [f"\033[36m{i:2d}\033[0m ".encode() if i % 5 == 0 else b"   "
+                    for i in range(height)]
+        self._screen_start = b"\033[H" + prefixes[0]
+        self._line_breaks = [self._NEXT_LINE + prefix for prefix in prefixes[1:]]
+        self._blank_lines = memoryview(self._NEXT_LINE * height)
+        
+        return converter
     
     def reset_performance_metrics(self):
         """Reset all performance metrics and frame timing."""
-        self.frame_times = np.zeros(30)  # Reset rolling window
+        self.frame_times = [0.0] * 30  # Reset rolling window
         self.frame_time_idx = 0
+        self._ft_sum = 0.0
+        self._ft_count = 0
         self.last_frame_time = 0
         self.cpu_usage = 0.0
         self.memory_usage = 0.0
+        self._last_stats_time = 0.0
         self.actual_fps = 0.0
         self.frame_deficit = 0.0
         self.skipped_frames = 0
@@ -160,8 +237,17 @@ class ASCIIWebcam:
             # Reset performance metrics
             self.reset_performance_metrics()
             
-            # Update converter with new dimensions
+            # Update converter and capture resolution with new dimensions
             self.converter = self.create_converter()
+            if self.cap is not None:
+                capturing = self._capture_thread is not None
+                # The capture device is not thread-safe, so leave it alone
+                # until a read in progress returns and retry on the next pass
+                if not self.stop_capture():
+                    return
+                self.configure_capture()
+                if capturing:
+                    self.start_capture()
             
             # Clear screen and force refresh display
             print("\033[2J\033[H", end="")  # Clear screen and move cursor home
@@ -179,25 +265,111 @@ class ASCIIWebcam:
             CameraError: If camera initialization fails
         """
         try:
+            # Let OpenCV parallelize resizing, leaving cores for capture and output
+            cv2.setUseOptimized(True)
+            cv2.setNumThreads(max(1, (os.cpu_count() or 1) // 2))
+            
             self.cap = cv2.VideoCapture(self.camera_id)
             if not self.cap.isOpened():
                 raise CameraError(f"Could not open camera {self.camera_id}")
+            self.configure_capture()
             
             # Try to capture a test frame
             ret, _ = self.cap.read()
             if not ret:
                 raise CameraError("Camera opened but failed to capture frame")
+            self.start_capture()
             
             # Clear screen once at startup
             print("\033[2J\033[H", end="")
+            self._drawn_frame = None
             self.error_message = None
         except Exception as e:
             self.error_message = f"Camera error: {e}. Press 'r' to retry or 'q' to quit."
             raise CameraError(str(e))
     
+    def configure_capture(self):
+        """Request a capture resolution close to what the terminal can show.
+        
+        Capturing near the target size saves USB bandwidth, decoding and
+        resizing work compared to the camera's native resolution. MJPG is
+        requested to avoid uncompressed YUYV transfers. Cameras pick the
+        nearest mode they support, and the converter resizes whatever
+        frames arrive. The driver is asked to queue a single frame so that
+        reads return the newest one rather than a backlog.
+        """
+        width = self.converter.width * self.CAPTURE_SUPERSAMPLE
+        height = self.converter.height * self.CAPTURE_SUPERSAMPLE / ASCIIConverter.CHAR_ASPECT
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, int(height))
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    
+    def start_capture(self):
+        """Start reading frames from the camera on a background thread.
+        
+        Capture then overlaps with converting and printing the previous
+        frame instead of blocking the main loop on the camera.
+        
+        Raises:
+            CameraError: If the previous capture thread is still reading
+        """
+        if not self.stop_capture():
+            raise CameraError("Previous capture thread is still reading from the camera")
+        with self._frame_lock:
+            self._latest_frame = None
+            self._capture_error = None
+            self._frame_ready.clear()
+        self._capture_stop = threading.Event()
+        self._capture_thread = threading.Thread(target=self._capture_loop, args=(self._capture_stop,),
+                                                daemon=True)
+        self._capture_thread.start()
+    
+    def stop_capture(self) -> bool:
+        """Stop the background capture thread if it is running.
+        
+        A thread blocked in a camera read can outlive the timeout. Its
+        handle is then kept, so that the caller does not touch the device
+        under it and a later call can wait for it again.
+        
+        Returns:
+            True if no capture thread is running any more
+        """
+        if self._capture_thread is None:
+            return True
+        self._capture_stop.set()
+        self._capture_thread.join(timeout=self.CAPTURE_TIMEOUT)
+        if self._capture_thread.is_alive():
+            return False
+        self._capture_thread = None
+        self._capture_stop = None
+        return True
+    
+    def _capture_loop(self, stop: threading.Event):
+        """Keep the frame slot filled with the newest camera frame.
+        
+        Args:
+            stop: Event set when this thread should exit
+        """
+        while not stop.is_set():
+            ret, frame = self.cap.read()
+            if stop.is_set():
+                break  # Stopped during the read, the frame is no longer wanted
+            with self._frame_lock:
+                if ret:
+                    self._latest_frame = frame
+                    self._capture_error = None
+                else:
+                    self._capture_error = "Failed to capture frame"
+                self._frame_ready.set()
+            if not ret:
+                time.sleep(0.1)  # Avoid spinning on a failing camera
+    
     def cleanup(self):
         """Clean up resources."""
-        if self.cap is not None:
+        # Never release the device under a thread still blocked in a read;
+        # it is a daemon thread and goes away with the process
+        if self.stop_capture() and self.cap is not None:
             try:
                 self.cap.release()
             except Exception:
@@ -211,6 +383,9 @@ class ASCIIWebcam:
     def capture_frame(self):
         """Capture a frame from the webcam.
         
+        With the capture thread running this waits for a frame newer than
+        the last one returned, otherwise it reads from the camera directly.
+        
         Returns:
             numpy.ndarray: Captured frame
         
@@ -221,10 +396,19 @@ class ASCIIWebcam:
             raise CameraError("Camera not initialized")
         
         try:
-            ret, frame = self.cap.read()
-            if not ret:
-                raise CameraError("Failed to capture frame")
-            return frame
+            if self._capture_thread is None:
+                ret, frame = self.cap.read()
+                if not ret:
+                    raise CameraError("Failed to capture frame")
+                return frame
+            
+            if not self._frame_ready.wait(timeout=self.CAPTURE_TIMEOUT):
+                raise CameraError("Timed out waiting for frame")
+            with self._frame_lock:
+                self._frame_ready.clear()
+                if self._capture_error is not None:
+                    raise CameraError(self._capture_error)
+                return self._latest_frame
         except Exception as e:
             self.error_message = f"Frame capture error: {e}. Press 'r' to retry or 'q' to quit."
             raise CameraError(str(e))
@@ -295,6 +479,8 @@ class ASCIIWebcam:
     def retry_camera(self):
         """Attempt to reinitialize the camera."""
         try:
+            if not self.stop_capture():
+                raise CameraError("Capture thread is still reading from the camera")
             if self.cap is not None:
                 self.cap.release()
             self.setup()
@@ -302,14 +488,17 @@ class ASCIIWebcam:
         except Exception as e:
             self.error_message = f"Camera retry failed: {e}. Press 'r' to retry again or 'q' to quit."
     
-    def handle_keyboard(self) -> bool:
+    def handle_keyboard(self, timeout: float = 0.0) -> bool:
         """Handle keyboard input.
         
+        Args:
+            timeout: Seconds to wait for a key press before returning
+            
         Returns:
             bool: True to continue running, False to exit
         """
-        # Check if there's input available
-        if select.select([sys.stdin], [], [], 0.0)[0]:
+        # Wait for input until the timeout expires
+        if select.select([sys.stdin], [], [], timeout)[0]:
             try:
                 key = sys.stdin.read(1)
                 if key == 'q':
@@ -339,35 +528,125 @@ class ASCIIWebcam:
         # Update frame timing
         if self.last_frame_time > 0:
             frame_time = current_time - self.last_frame_time
+            evicted = self.frame_times[self.frame_time_idx]
+            if evicted > 0:
+                self._ft_sum -= evicted
+                self._ft_count -= 1
+            if frame_time > 0:
+                self._ft_sum += frame_time
+                self._ft_count += 1
             self.frame_times[self.frame_time_idx] = frame_time
             self.frame_time_idx = (self.frame_time_idx + 1) % len(self.frame_times)
+            if self.frame_time_idx == 0:
+                # Re-sum once per window so floating point error cannot build up
+                self._ft_sum = sum(self.frame_times)
             
             # Calculate actual FPS from rolling average
-            actual_frame_time = np.mean(self.frame_times[self.frame_times > 0])
-            self.actual_fps = 1.0 / actual_frame_time if actual_frame_time > 0 else 0.0
+            self.actual_fps = self._ft_count / self._ft_sum if self._ft_sum > 0 else 0.0
             
             # Update frame deficit
             self.frame_deficit += frame_time - self.frame_budget
         
         self.last_frame_time = current_time
         
-        # Update CPU and memory usage (every 30 frames)
-        if self.frame_num % 30 == 0:
+        # Update CPU and memory usage (every STATS_INTERVAL seconds)
+        if current_time - self._last_stats_time > self.STATS_INTERVAL:
+            self._last_stats_time = current_time
             self.cpu_usage = self.process.cpu_percent()
             self.memory_usage = self.process.memory_info().rss / 1024 / 1024  # MB
             # Reset frame deficit periodically to prevent drift
             self.frame_deficit = max(0, min(self.frame_deficit, self.frame_budget * 2))
     
+    def status_line(self, width: int, height: int, frame_time: float) -> bytes:
+        """Get the encoded status line, rebuilding it at most every STATUS_INTERVAL.
+        
+        The line is rebuilt right away when the terminal size or a setting
+        it shows changes; the performance figures refresh on the interval.
+        
+        Args:
+            width: Terminal width in characters
+            height: Terminal height in lines
+            frame_time: Seconds taken to convert the current frame
+        
+        Returns:
+            Status line with a clear-to-end escape, centered to the width
+        """
+        current_time = time.time()
+        key = (width, height, self.frame_rate, self.preset, self.color_scheme, self.show_help)
+        if key == self._status_key and current_time - self._status_time < self.STATUS_INTERVAL:
+            return self._status_bytes
+        self._status_key = key
+        self._status_time = current_time
+        
+        # Create status line with size and current settings
+        status_parts = [
+            f"Size: {width}×{height}",
+            f"Target FPS: {self.frame_rate:.1f}",
+            f"Actual FPS: {self.actual_fps:.1f}",
+            f"CPU: {self.cpu_usage:.1f}%",
+            f"Mem: {self.memory_usage:.1f}MB",
+            f"Frame: {frame_time*1000:.1f}ms",
+            f"Preset: {self.preset}",
+            f"Scheme: {self.color_scheme}"
+        ]
+        
+        # Add controls if help is enabled
+        if self.show_help:
+            status_parts.append(self._controls_text)
+        
+        # Join all parts with separators
+        status_line = " | ".join(status_parts)
+        
+        # Calculate available width (accounting for padding)
+        available_width = width - 2  # -2 for padding
+        
+        # Truncate status line if too long
+        if len(status_line) > available_width:
+            status_line = status_line[:available_width-3] + "..."
+        
+        # Centered status line
+        self._status_bytes = f"\033[K{status_line.center(width)}".encode()
+        return self._status_bytes
+    
+    def buffer_output(self, pos: int, data: bytes) -> int:
+        """Copy data into the reusable screen buffer.
+        
+        Args:
+            pos: Offset in the buffer to write at
+            data: Encoded bytes to copy
+        
+        Returns:
+            Offset just past the copied data
+        """
+        end = pos + len(data)
+        if end > len(self._output_buffer):
+            # Only reached if the size estimate was too small
+            self._output_view.release()
+            self._output_buffer.extend(bytes(end - len(self._output_buffer)))
+            self._output_view = memoryview(self._output_buffer)
+        self._output_view[pos:end] = data
+        return end
+    
+    def write_output(self, data: bytes):
+        """Write a pre-assembled block of terminal output in a single call.
+        
+        Args:
+            data: Encoded bytes including any ANSI control codes
+        """
+        sys.stdout.flush()  # Keep ordering with anything written via print()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    
     def print_display(self):
         """Print the current display using ANSI control codes."""
         try:
             width, height = self.terminal_size
             
-            # Move cursor to home position
-            print("\033[H", end="")
-            
             if self.error_message is not None:
+                self._drawn_frame = None  # The next frame has to redraw the screen
+                
                 # Display error message
+                print("\033[H", end="")  # Move cursor to home position
                 print("\033[31m")  # Red text
                 print(self.error_message.center(width))
                 print("\033[0m")  # Reset color
@@ -376,56 +655,37 @@ class ASCIIWebcam:
             try:
                 # Get ASCII art from converter
                 frame_start = time.time()
-                ascii_frame = self.converter.convert_frame(self.capture_frame())
+                ascii_frame = self.converter.convert_frame_ansi(self.capture_frame())
                 frame_time = time.time() - frame_start
+                status = self.status_line(width, height, frame_time) if self.show_status else None
                 
-                lines = ascii_frame.split('\n')
-                
-                # Print each line with line numbers
-                for i, line in enumerate(lines):
-                    # Add line number if it's a multiple of 5
-                    prefix = f"\033[36m{i:2d}\033[0m " if i % 5 == 0 else "   "
-                    # Print line with clear to end
-                    print(f"{prefix}{line}\033[K", end="")
-                    # Move cursor to next line
-                    print("\033[1E", end="")
-                
-                # Clear any remaining lines
-                for i in range(len(lines), height - 1):
-                    print("\033[K", end="")
-                    print("\033[1E", end="")
-                
-                # Print status at the bottom if enabled
-                if self.show_status:
-                    # Create status line with size and current settings
-                    status_parts = [
-                        f"Size: {width}×{height}",
-                        f"Target FPS: {self.frame_rate:.1f}",
-                        f"Actual FPS: {self.actual_fps:.1f}",
-                        f"CPU: {self.cpu_usage:.1f}%",
-                        f"Mem: {self.memory_usage:.1f}MB",
-                        f"Frame: {frame_time*1000:.1f}ms",
-                        f"Preset: {self.preset}",
-                        f"Scheme: {self.color_scheme}"
-                    ]
+                # The converter returns the same object for a frame it did not
+                # render again, and the status line is cached too, so when
+                # both are the ones on screen there is nothing to write
+                if ascii_frame is not self._drawn_frame or status is not self._drawn_status:
+                    lines = ascii_frame.split(b'\n')
                     
-                    # Add controls if help is enabled
-                    if self.show_help:
-                        controls = " | ".join(f"{k}: {v}" for k, v in self.CONTROLS.items())
-                        status_parts.append(controls)
+                    # Assemble the whole screen in the reused buffer, starting
+                    # from the home position with the first line number
+                    buffer_output = self.buffer_output
+                    pos = buffer_output(0, self._screen_start)
+                    for line, line_break in zip(lines[:-1], self._line_breaks):
+                        pos = buffer_output(pos, line)
+                        pos = buffer_output(pos, line_break)
+                    pos = buffer_output(pos, lines[-1])
                     
-                    # Join all parts with separators
-                    status_line = " | ".join(status_parts)
+                    # Clear the last line and any remaining lines below it
+                    blank_lines = max(height - len(lines), 1)
+                    pos = buffer_output(pos, self._blank_lines[:blank_lines * len(self._NEXT_LINE)])
                     
-                    # Calculate available width (accounting for padding)
-                    available_width = width - 2  # -2 for padding
+                    # Print status at the bottom if enabled
+                    if status is not None:
+                        pos = buffer_output(pos, status)
                     
-                    # Truncate status line if too long
-                    if len(status_line) > available_width:
-                        status_line = status_line[:available_width-3] + "..."
-                    
-                    # Print centered status line
-                    print(f"\033[K{status_line.center(width)}", end="")
+                    # Single write for the whole screen
+                    self.write_output(self._output_view[:pos])
+                    self._drawn_frame = ascii_frame
+                    self._drawn_status = status
                 
                 # Update performance stats
                 self.frame_num += 1
@@ -487,12 +747,9 @@ class ASCIIWebcam:
                         self.print_display()
                         last_frame_time = current_time
                     
-                    # Handle keyboard input with shorter timeout
-                    running = self.handle_keyboard()
-                    
-                    # Adaptive sleep based on frame deficit
-                    sleep_time = max(0.001, min(0.01, frame_interval - self.frame_deficit))
-                    time.sleep(sleep_time)
+                    # Wait for a key press until the next frame is due
+                    timeout = max(0.0, last_frame_time + frame_interval - time.time())
+                    running = self.handle_keyboard(timeout)
                 except Exception as e:
                     self.error_message = f"Runtime error: {e}. Press 'r' to retry or 'q' to quit."
                     time.sleep(1)  # Prevent error message flood
@@ -523,14 +780,24 @@ def print_presets():
     click.echo("\nAvailable color schemes:")
     for scheme in ASCIIConverter.available_color_schemes():
         click.echo(f"  {scheme:8} - {scheme.title()} colors")
+    
+    # Print palettes
+    click.echo("\nAvailable palettes:")
+    click.echo(f"  {'truecolor':9} - 24-bit colors (best quality)")
+    click.echo(f"  {'512':9} - 24-bit escapes with 8 levels per channel (fewer escapes)")
+    click.echo(f"  {'256':9} - xterm 256 colors (less output, faster terminals)")
 
 @click.command()
 @click.option('--camera', '-c', default=0, help='Camera device ID (default: 0)')
 @click.option('--width', '-w', default=80, help='Width of ASCII output (default: 80)')
 @click.option('--preset', '-p', default='classic', help='Character preset to use (default: classic)')
 @click.option('--scheme', '-s', default='true', help='Color scheme to use (default: true)')
+@click.option('--palette', default='truecolor', help='Terminal color palette: truecolor, 512 or 256 (default: truecolor)')
+@click.option('--noise-threshold', default=0, type=click.IntRange(0, 255),
+              help='Redraw only when a color channel changes by more than this (default: 0)')
 @click.option('--list-presets', '-l', is_flag=True, help='List available presets and color schemes and exit')
-def main(camera: int, width: int, preset: str, scheme: str, list_presets: bool):
+def main(camera: int, width: int, preset: str, scheme: str, palette: str, noise_threshold: int,
+         list_presets: bool):
     """Real-time ASCII art webcam viewer in the terminal."""
     if list_presets:
         print_presets()
@@ -546,7 +813,13 @@ def main(camera: int, width: int, preset: str, scheme: str, list_presets: bool):
         print_presets()
         return
     
-    app = ASCIIWebcam(camera_id=camera, preset=preset, color_scheme=scheme)
+    if palette not in ASCIIConverter.PALETTES:
+        click.echo(f"Error: Unknown palette '{palette}'")
+        print_presets()
+        return
+    
+    app = ASCIIWebcam(camera_id=camera, preset=preset, color_scheme=scheme, palette=palette,
+                      noise_threshold=noise_threshold)
     app.run()
 
 if __name__ == '__main__':
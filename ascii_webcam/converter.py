@@ -1,11 +1,13 @@
 """ASCII conversion module for transforming webcam frames to ASCII art."""
 
+import os
+import zlib
 import numpy as np
 import cv2
-from rich.text import Text
-from rich.style import Style
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Callable, Tuple, Optional
-from functools import lru_cache
+
+from ._fast import build_ansi
 
 class ASCIIConverter:
     """Converts image frames to ASCII art with color support."""
@@ -49,85 +51,198 @@ class ASCIIConverter:
         ),  # Purple/pink hues
     }
     
-    def __init__(self, preset: str = 'classic', width: int = 80, height: int = None, color_scheme: str = 'true'):
+    # Terminal color palettes: escape prefix and number of decimal color fields
+    PALETTES: Dict[str, Tuple[bytes, int]] = {
+        'truecolor': (b"\033[38;2;", 3),  # 24-bit "R;G;B"
+        '512': (b"\033[38;2;", 3),        # "R;G;B" with 8 levels per channel
+        '256': (b"\033[38;5;", 1),        # xterm 256-color index
+    }
+    
+    # Bits kept per channel by the '512' palette, and the offset that moves
+    # each quantized value to the middle of its bucket
+    _LEVEL_MASK = 0xE0
+    _LEVEL_CENTER = 0x10
+    
+    _ROW_END = b"\033[0m\n"
+    
+    # Width to height ratio of a terminal character cell
+    CHAR_ASPECT = 0.45
+    
+    # Most row stripes the compiled renderer works on concurrently, and the
+    # thread pool shared by all converters for them
+    MAX_RENDER_STRIPES = 4
+    _render_pool: Optional[ThreadPoolExecutor] = None
+    
+    def __init__(self, preset: str = 'classic', width: int = 80, height: int = None, color_scheme: str = 'true',
+                 palette: str = 'truecolor', noise_threshold: int = 0):
         """Initialize the ASCII converter."""
         if preset not in self.CHAR_PRESETS:
             raise ValueError(f"Unknown preset '{preset}'. Available presets: {list(self.CHAR_PRESETS.keys())}")
         if color_scheme not in self.COLOR_SCHEMES:
             raise ValueError(f"Unknown color scheme '{color_scheme}'. Available schemes: {list(self.COLOR_SCHEMES.keys())}")
+        if palette not in self.PALETTES:
+            raise ValueError(f"Unknown palette '{palette}'. Available palettes: {list(self.PALETTES.keys())}")
+        if not 0 <= noise_threshold <= 255:
+            raise ValueError(f"Invalid noise threshold {noise_threshold}. Must be between 0 and 255")
         
         self.chars = self.CHAR_PRESETS[preset]
         self.width = width
         self.height = height
         self.char_range = len(self.chars) - 1
         self.color_scheme_name = color_scheme  # Store the name
+        self.palette = palette
+        self.noise_threshold = noise_threshold
         
         # Cache for frame dimensions and buffers
         self._last_frame_dims: Optional[Tuple[int, int]] = None
         self._last_target_dims: Optional[Tuple[int, int]] = None
+        self._last_new_dims: Optional[Tuple[int, int]] = None
         self._resized_buffer: Optional[np.ndarray] = None
         self._gray_buffer: Optional[np.ndarray] = None
         self._char_buffer: Optional[np.ndarray] = None
         self._color_buffer: Optional[np.ndarray] = None
-        self._intensity_buffer: Optional[np.ndarray] = None
-        self._char_indices_buffer: Optional[np.ndarray] = None
+        self._quantized_buffer: Optional[np.ndarray] = None
         
-        # Pre-compute character array for faster mapping
+        # Shape and checksum of the last resized frame and its rendered output
+        self._last_frame_key: Optional[Tuple[Tuple[int, ...], int]] = None
+        self._last_ansi = b""
+        
+        # Resized frame the last output was rendered from, when small changes
+        # are treated as noise, and the difference against it
+        self._reference_frame: Optional[np.ndarray] = None
+        self._diff_buffer: Optional[np.ndarray] = None
+        
+        # Pre-compute the character for every possible intensity value
+        char_indices = np.arange(256) * self.char_range // 255
         self._char_array = np.array(list(self.chars))
+        self._char_lut = self._char_array[char_indices]
+        
+        # UTF-8 bytes of each character padded to the widest one in the preset,
+        # and which of those bytes to keep, again for every intensity value
+        encoded = [char.encode('utf-8') for char in self.chars]
+        self._char_width = max(len(char_bytes) for char_bytes in encoded)
+        char_bytes = np.zeros((len(encoded), self._char_width), dtype=np.uint8)
+        char_keep = np.zeros((len(encoded), self._char_width), dtype=bool)
+        for i, char in enumerate(encoded):
+            char_bytes[i, :len(char)] = list(char)
+            char_keep[i, :len(char)] = True
+        self._char_bytes_lut = char_bytes[char_indices]
+        self._char_bytes_keep = char_keep[char_indices]
+        self._char_lengths = char_keep.sum(axis=1).astype(np.uint8)[char_indices]
+        self._fixed_width_chars = bool(char_keep.all())
         
-        # Pre-compute ANSI color code template and parts
-        self._color_start = "\033[38;2;"
-        self._color_sep = ";"
-        self._color_end = "m"
-        self._color_reset = "\033[0m"
+        # Fixed-width output cell: escape prefix, "DDD;" color fields with the
+        # last one ending in "m", then the character bytes
+        escape, num_fields = self.PALETTES[palette]
+        self._cell_prefix = escape + b"000;" * (num_fields - 1) + b"000m"
+        self._color_fields = slice(len(escape), len(self._cell_prefix))
+        self._num_color_fields = num_fields
+        self._cell_len = len(self._cell_prefix) + self._char_width
+        self._escape_bytes = np.frombuffer(escape, dtype=np.uint8)
+        self._row_end_bytes = np.frombuffer(self._ROW_END, dtype=np.uint8)
         
-        # Pre-allocate string builders for each line
-        self._line_builders = []
-        self._line_parts = []  # For building lines more efficiently
+        # Decimal digits plus terminator (as ASCII) for every channel value,
+        # one block of 256 rows per channel, and which entries to keep so that
+        # values are written without leading zeros
+        values = np.arange(256)
+        digits = np.stack([values // 100, values // 10 % 10, values % 10], axis=-1) + ord('0')
+        self._digit_lut = np.empty((3, 256, 4), dtype=np.uint8)
+        self._digit_lut[..., :3] = digits
+        self._digit_lut[..., 3] = [[ord(';')], [ord(';')], [ord('m')]]
+        self._digit_lut = self._digit_lut.reshape(-1, 4)
+        self._digit_keep = np.ones((3, 256, 4), dtype=bool)
+        self._digit_keep[..., 0] = values >= 100
+        self._digit_keep[..., 1] = values >= 10
+        self._digit_keep = self._digit_keep.reshape(-1, 4)
+        # Use the last blocks so that only the final field ends in "m"
+        self._channel_offsets = (np.arange(3 - num_fields, 3) * 256).astype(np.uint16)
+        # Left-aligned digits of every value and their count, for the
+        # compiled renderer which copies them with a single table lookup
+        digit_text = [str(value).encode() for value in range(256)]
+        self._digit_bytes = np.array([list(text.ljust(3, b"0")) for text in digit_text],
+                                     dtype=np.uint8)
+        self._digit_lengths = np.array([len(text) for text in digit_text], dtype=np.uint8)
+        
+        # Nearest xterm color cube entry for every 15-bit (5 bits per channel) RGB
+        self._xterm_lut = self._xterm_cube_lut() if palette == '256' else None
+        
+        # Pre-computed ANSI output buffer and its keep mask
+        self._ansi_buffer: Optional[np.ndarray] = None
+        self._ansi_mask: Optional[np.ndarray] = None
+        self._color_changed: Optional[np.ndarray] = None
+        self._field_changed: Optional[np.ndarray] = None
+        self._output_buffer: Optional[np.ndarray] = None
+        # The Numba kernel releases the GIL, so stripes of rows can be
+        # rendered in parallel on multi-core machines
+        self._render_stripes = (min(os.cpu_count() or 1, self.MAX_RENDER_STRIPES)
+                                if build_ansi is not None else 1)
         
         # Create optimized color scheme function
         self._setup_color_function(color_scheme)
+        
+        # Conversion pipeline with the scheme, palette and renderer baked in
+        self._fast = self._build_specialized()
     
     def _setup_color_function(self, color_scheme: str):
         """Set up the optimized color function for the given scheme."""
         if color_scheme == 'true':
+            self._color_matrix = None
+            
             # Simple BGR to RGB swap with buffer reuse
             def true_color(frame):
                 if self._color_buffer is None or self._color_buffer.shape != frame.shape:
                     self._color_buffer = np.empty_like(frame, dtype=np.uint8)
-                # Reorder channels into pre-allocated buffer
-                self._color_buffer[..., 0] = frame[..., 2]  # R = B
-                self._color_buffer[..., 1] = frame[..., 1]  # G = G
-                self._color_buffer[..., 2] = frame[..., 0]  # B = R
+                # cvtColor only writes into dst when the depths match
+                if frame.dtype != np.uint8:
+                    frame = frame.astype(np.uint8)
+                # Reorder channels into pre-allocated buffer in a single pass
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._color_buffer)
                 return self._color_buffer
             self._color_func_vec = true_color
-        elif color_scheme == 'matrix':
-            # Optimized matrix effect
-            def matrix_color(frame):
-                result = np.zeros_like(frame, dtype=np.uint8)
-                result[..., 1] = np.minimum(frame[..., 1] * 1.5, 255).astype(np.uint8)
-                return result
-            self._color_func_vec = matrix_color
         else:
-            # Optimized color scheme with pre-allocated buffer
-            color_func = self.COLOR_SCHEMES[color_scheme]  # Get the color function directly
-            def optimized_color_func(frame):
+            # Every other scheme is a per-channel linear scaling, so apply it as a
+            # single saturating 3x3 transform instead of float math per channel
+            matrix = self._color_matrix = self._scheme_matrix(color_scheme)
+            def transformed_color(frame):
                 if self._color_buffer is None or self._color_buffer.shape != frame.shape:
                     self._color_buffer = np.empty_like(frame, dtype=np.uint8)
-                
-                # Process each color channel separately for better vectorization
-                b, g, r = frame[..., 0].astype(np.float32), frame[..., 1].astype(np.float32), frame[..., 2].astype(np.float32)
-                
-                # Apply color function and combine channels
-                r_out, g_out, b_out = color_func(b, g, r)
-                
-                # Stack channels and ensure proper type
-                self._color_buffer[..., 0] = b_out.astype(np.uint8)
-                self._color_buffer[..., 1] = g_out.astype(np.uint8)
-                self._color_buffer[..., 2] = r_out.astype(np.uint8)
-                
+                # transform only writes into dst when the depths match
+                if frame.dtype != np.uint8:
+                    frame = frame.astype(np.uint8)
+                cv2.transform(frame, matrix, dst=self._color_buffer)
                 return self._color_buffer
-            self._color_func_vec = optimized_color_func
+            self._color_func_vec = transformed_color
+    
+    @classmethod
+    def _scheme_matrix(cls, color_scheme: str) -> np.ndarray:
+        """Express a color scheme function as a BGR to BGR transform matrix.
+        
+        Args:
+            color_scheme: Name of a scheme in COLOR_SCHEMES taking (b, g, r)
+                and returning (r, g, b)
+        
+        Returns:
+            3x3 float32 matrix whose rows are the output B, G, R channels
+        
+        Raises:
+            ValueError: If the scheme is not a saturating linear mix of the
+                input channels, so no transform can reproduce it
+        """
+        color_func = cls.COLOR_SCHEMES[color_scheme]
+        matrix = np.zeros((3, 3), dtype=np.float32)
+        for column, (b, g, r) in enumerate(np.eye(3)):
+            r_out, g_out, b_out = color_func(b, g, r)
+            matrix[:, column] = (b_out, g_out, r_out)
+        
+        # Check the matrix against the scheme on a grid of BGR colors
+        levels = np.array([0, 60, 128, 200, 255], dtype=np.float32)
+        probe = np.stack(np.meshgrid(levels, levels, levels, indexing='ij'), axis=-1).reshape(-1, 3)
+        r_out, g_out, b_out = color_func(probe[:, 0], probe[:, 1], probe[:, 2])
+        expected = np.stack(np.broadcast_arrays(b_out, g_out, r_out), axis=-1)
+        if not np.allclose(np.clip(probe @ matrix.T, 0, 255), expected, atol=0.5):
+            raise ValueError(f"Color scheme '{color_scheme}' is not a linear scaling of the "
+                             f"color channels and cannot be applied as a transform")
+        return matrix
     
     @classmethod
     def available_presets(cls) -> list[str]:
@@ -139,7 +254,6 @@ class ASCIIConverter:
         """Get list of available color schemes."""
         return list(cls.COLOR_SCHEMES.keys())
     
-    @lru_cache(maxsize=32)
     def _calculate_dimensions(self, frame_width: int, frame_height: int) -> Tuple[int, int]:
         """Calculate target dimensions for frame resizing.
         
@@ -159,11 +273,11 @@ class ASCIIConverter:
             # If height is specified, use it as a constraint
             new_height = min(self.height, frame_height)
             # Adjust width to maintain aspect ratio if needed
-            width_by_height = int(new_height / aspect_ratio / 0.45)  # 0.45 for terminal char aspect
+            width_by_height = int(new_height / aspect_ratio / self.CHAR_ASPECT)
             new_width = min(new_width, width_by_height)
         else:
             # Use width to determine height, accounting for terminal character aspect ratio
-            new_height = int(new_width * aspect_ratio * 0.45)
+            new_height = int(new_width * aspect_ratio * self.CHAR_ASPECT)
         
         # Ensure minimum dimensions
         new_width = max(new_width, 10)
@@ -182,22 +296,21 @@ class ASCIIConverter:
             new_width, new_height = self._calculate_dimensions(frame_width, frame_height)
             self._last_frame_dims = (frame_width, frame_height)
             self._last_target_dims = (self.width, self.height)
+            self._last_new_dims = (new_width, new_height)
             
             # Reallocate buffers if needed
             if (self._resized_buffer is None or 
                 self._resized_buffer.shape[:2] != (new_height, new_width)):
                 self._resized_buffer = np.empty((new_height, new_width, 3), dtype=np.uint8)
                 self._gray_buffer = np.empty((new_height, new_width), dtype=np.uint8)
-                self._char_buffer = np.empty((new_height, new_width), dtype='<U1')
-                self._color_buffer = np.empty((new_height, new_width, 3), dtype=np.uint8)
-                self._intensity_buffer = np.empty((new_height, new_width), dtype=np.float32)
-                self._char_indices_buffer = np.empty((new_height, new_width), dtype=np.int32)
-                self._line_builders = [''] * new_height
-                self._line_parts = [[] for _ in range(new_height)]
+                # The true scheme renders straight from the resized frame
+                if self._color_matrix is not None:
+                    self._color_buffer = np.empty((new_height, new_width, 3), dtype=np.uint8)
         else:
-            new_width, new_height = self._calculate_dimensions(frame_width, frame_height)
+            new_width, new_height = self._last_new_dims
         
-        # Resize into pre-allocated buffer
+        # Resize into pre-allocated buffer, averaging all the camera pixels
+        # behind each cell so that sensor noise does not flicker the output
         cv2.resize(frame, (new_width, new_height), dst=self._resized_buffer, interpolation=cv2.INTER_AREA)
         return self._resized_buffer
     
@@ -208,54 +321,267 @@ class ASCIIConverter:
     
     def _map_intensity_to_chars(self, intensity: np.ndarray) -> np.ndarray:
         """Map grayscale intensities to ASCII characters."""
-        # Pre-allocate buffers if needed
-        if self._char_indices_buffer is None or self._char_indices_buffer.shape != intensity.shape:
-            self._char_indices_buffer = np.empty_like(intensity, dtype=np.int32)
-            self._intensity_buffer = np.empty_like(intensity, dtype=np.float32)
-        
-        # Normalize intensity to match char range (using pre-allocated buffer)
-        np.multiply(intensity, self.char_range / 255.0, out=self._intensity_buffer, dtype=np.float32)
-        # First clip in float32
-        np.clip(self._intensity_buffer, 0, self.char_range, out=self._intensity_buffer)
-        # Then convert to int32
-        np.floor(self._intensity_buffer, out=self._intensity_buffer)
-        np.copyto(self._char_indices_buffer, self._intensity_buffer.astype(np.int32))
-        
-        # Map indices to characters using pre-computed array
-        np.take(self._char_array, self._char_indices_buffer, out=self._char_buffer)
+        if self._char_buffer is None or self._char_buffer.shape != intensity.shape:
+            self._char_buffer = np.empty(intensity.shape, dtype='<U1')
+        
+        # Single gather from the intensity lookup table
+        np.take(self._char_lut, intensity, out=self._char_buffer)
         return self._char_buffer
     
-    def _create_ansi_text(self, frame: np.ndarray, ascii_chars: np.ndarray) -> str:
-        """Create a string with ANSI color codes for the ASCII art."""
-        height, width = ascii_chars.shape
+    @staticmethod
+    def _xterm_cube_lut() -> np.ndarray:
+        """Build the lookup table from 15-bit packed RGB to xterm color cube indices.
+        
+        Returns:
+            uint8 array of 32768 palette indices (16-231), indexed by
+            ``r5 << 10 | g5 << 5 | b5``
+        """
+        levels = np.array([0, 95, 135, 175, 215, 255])  # xterm cube channel levels
+        centers = (np.arange(32) << 3) + 4  # Midpoint of each 5-bit bucket
+        nearest = np.abs(centers[:, None] - levels[None, :]).argmin(axis=1)
+        r, g, b = np.meshgrid(nearest, nearest, nearest, indexing='ij')
+        return (16 + 36 * r + 6 * g + b).astype(np.uint8).ravel()
+    
+    def _xterm_indices(self, colors: np.ndarray) -> np.ndarray:
+        """Quantize BGR colors to xterm 256-color palette indices.
+        
+        Args:
+            colors: BGR frame, resized or as returned by a color scheme
+        
+        Returns:
+            uint8 array of palette indices with the frame's height and width
+        """
+        quantized = (colors >> 3).astype(np.uint16)
+        packed = quantized[..., 2] << 10 | quantized[..., 1] << 5 | quantized[..., 0]
+        return np.take(self._xterm_lut, packed)
+    
+    def _quantize_levels(self, colors: np.ndarray) -> np.ndarray:
+        """Reduce colors to 8 levels per channel for the '512' palette.
         
-        # Apply color scheme to entire frame at once
-        colors = self._color_func_vec(frame)
+        Fewer distinct colors make longer runs of equal color, so fewer
+        escapes are written.
         
-        # Ensure we have enough line parts
-        if len(self._line_parts) < height:
-            self._line_parts = [[] for _ in range(height)]
+        Args:
+            colors: uint8 color frame in any channel order
+        
+        Returns:
+            Reused buffer with every channel moved to its bucket center
+        """
+        if self._quantized_buffer is None or self._quantized_buffer.shape != colors.shape:
+            self._quantized_buffer = np.empty_like(colors, dtype=np.uint8)
+        np.bitwise_and(colors, self._LEVEL_MASK, out=self._quantized_buffer)
+        np.bitwise_or(self._quantized_buffer, self._LEVEL_CENTER, out=self._quantized_buffer)
+        return self._quantized_buffer
+    
+    def _allocate_ansi_buffers(self, height: int, width: int):
+        """Allocate the output buffer and fill in the constant escape bytes.
+        
+        Every row is laid out as ``width`` fixed-size cells followed by the
+        row terminator, so only the digits and the character of each cell
+        have to be written per frame. Leading zeros, character padding and
+        the final newline are dropped through the keep mask when the output
+        is assembled.
+        """
+        cell = self._cell_prefix + b" " * self._char_width
+        row = np.frombuffer(cell * width + self._ROW_END, dtype=np.uint8)
+        self._ansi_buffer = np.tile(row, (height, 1))
+        self._ansi_mask = np.ones(self._ansi_buffer.shape, dtype=bool)
+        self._ansi_mask[-1, -1] = False  # No newline after the last row
+        self._color_changed = np.ones((height, width), dtype=bool)  # First column always starts a run
+        self._field_changed = np.empty((height, width - 1), dtype=bool)
+    
+    def _build_specialized(self) -> Callable[[np.ndarray], bytes]:
+        """Build the frame conversion function for this converter's settings.
+        
+        The color scheme, palette and renderer are fixed for the lifetime of
+        a converter, so they are resolved once here and bound into a closure,
+        leaving no per-frame dispatch on them. Frames that resize to the
+        same pixels as the previous one skip rendering entirely, as do
+        frames within the noise threshold of the last rendered one.
+        
+        Returns:
+            Function converting a BGR frame to UTF-8 encoded ANSI bytes
+        """
+        resize = self._resize_frame
+        to_grayscale = self._frame_to_grayscale
+        render = self._render_compiled if build_ansi is not None else self._render_vectorized
         
-        # Process each line using pre-allocated builders
-        for y in range(height):
-            parts = self._line_parts[y]
-            parts.clear()
+        # Colors stay in BGR order all the way to the renderer. The true
+        # scheme reads the resized frame in place instead of copying it.
+        if self.color_scheme_name == 'true':
+            bgr_colors = lambda resized: resized
+        else:
+            bgr_colors = self._color_func_vec
+        
+        if self._xterm_lut is not None:
+            xterm_indices = self._xterm_indices
             
-            # Build line with minimal string operations
-            for x in range(width):
-                r, g, b = colors[y, x]
-                parts.extend((
-                    self._color_start,
-                    str(r), self._color_sep,
-                    str(g), self._color_sep,
-                    str(b), self._color_end,
-                    ascii_chars[y, x]
-                ))
-            parts.append(self._color_reset)
-            self._line_builders[y] = ''.join(parts)
-        
-        # Join all lines with newlines
-        return '\n'.join(self._line_builders)
+            def encode(resized: np.ndarray) -> bytes:
+                # The escape carries a single palette index per cell
+                return render(xterm_indices(bgr_colors(resized))[..., None], to_grayscale(resized))
+        elif self.palette == '512':
+            quantize_levels = self._quantize_levels
+            
+            def encode(resized: np.ndarray) -> bytes:
+                return render(quantize_levels(bgr_colors(resized))[..., ::-1], to_grayscale(resized))
+        else:
+            def encode(resized: np.ndarray) -> bytes:
+                # A reversed view puts the fields in the escape's R;G;B order
+                return render(bgr_colors(resized)[..., ::-1], to_grayscale(resized))
+        
+        if self.noise_threshold > 0:
+            noise_threshold = self.noise_threshold
+            
+            def convert(frame: np.ndarray) -> bytes:
+                resized = resize(frame)
+                
+                # Compare against the frame the current output was rendered
+                # from, not the previous one, so slow changes still add up
+                reference = self._reference_frame
+                if reference is not None and reference.shape == resized.shape:
+                    cv2.absdiff(resized, reference, dst=self._diff_buffer)
+                    if self._diff_buffer.max() <= noise_threshold:
+                        return self._last_ansi
+                    np.copyto(reference, resized)
+                else:
+                    self._reference_frame = resized.copy()
+                    self._diff_buffer = np.empty_like(resized)
+                self._last_ansi = encode(resized)
+                return self._last_ansi
+            
+            return convert
+        
+        def convert(frame: np.ndarray) -> bytes:
+            resized = resize(frame)
+            
+            # A frame identical to the previous one (a still or virtual camera)
+            # reuses the previous output instead of being rendered again. The
+            # checksum only covers the pixels, so the shape is part of the key.
+            frame_key = (resized.shape, zlib.crc32(resized))
+            if frame_key != self._last_frame_key:
+                self._last_frame_key = frame_key
+                self._last_ansi = encode(resized)
+            return self._last_ansi
+        
+        return convert
+    
+    def max_output_bytes(self, width: int, height: int) -> int:
+        """Get an upper bound on the size of a converted frame.
+        
+        Args:
+            width: Frame width in characters
+            height: Frame height in lines
+        
+        Returns:
+            Maximum number of bytes returned by convert_frame_ansi
+        """
+        return height * (width * self._cell_len + len(self._ROW_END))
+    
+    def _render_compiled(self, values: np.ndarray, intensity: np.ndarray) -> bytes:
+        """Render a frame with the Numba kernel into a reused output buffer.
+        
+        Args:
+            values: Color fields per cell, shaped (height, width, fields)
+            intensity: Grayscale frame selecting the characters
+        
+        Returns:
+            Rows of colored characters separated by newlines
+        """
+        height, width = intensity.shape
+        max_len = self.max_output_bytes(width, height)
+        if self._output_buffer is None or self._output_buffer.size != max_len:
+            self._output_buffer = np.empty(max_len, dtype=np.uint8)
+        
+        tables = (self._escape_bytes, self._digit_bytes, self._digit_lengths,
+                  self._char_bytes_lut, self._char_lengths, self._row_end_bytes)
+        stripes = min(self._render_stripes, height)
+        if stripes == 1:
+            length = build_ansi(values, intensity, *tables, self._output_buffer)
+            return self._output_buffer[:length].tobytes()
+        
+        # Each stripe of rows gets its own region of the buffer, sized for the
+        # worst case, and the kernel runs on them from the shared pool
+        row_len = self.max_output_bytes(width, 1)
+        bounds = np.linspace(0, height, stripes + 1).astype(int)
+        pool = self._get_render_pool()
+        futures = [pool.submit(build_ansi, values[start:stop], intensity[start:stop], *tables,
+                               self._output_buffer[start * row_len:stop * row_len])
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        
+        # The kernel leaves out each stripe's final newline, so join with it
+        parts = [self._output_buffer[start * row_len:start * row_len + future.result()]
+                 for start, future in zip(bounds[:-1], futures)]
+        return b"\n".join(parts)
+    
+    @classmethod
+    def _get_render_pool(cls) -> ThreadPoolExecutor:
+        """Get the thread pool for rendering row stripes, creating it on first use."""
+        if ASCIIConverter._render_pool is None:
+            ASCIIConverter._render_pool = ThreadPoolExecutor(max_workers=cls.MAX_RENDER_STRIPES,
+                                                             thread_name_prefix='ascii-render')
+        return ASCIIConverter._render_pool
+    
+    def _render_vectorized(self, values: np.ndarray, intensity: np.ndarray) -> bytes:
+        """Render a frame with NumPy gathers into the fixed-width cell buffer.
+        
+        Args:
+            values: Color fields per cell, shaped (height, width, fields)
+            intensity: Grayscale frame selecting the characters
+        
+        Returns:
+            Rows of colored characters separated by newlines
+        """
+        height, width = intensity.shape
+        cell_len = self._cell_len
+        
+        if (self._ansi_buffer is None or
+                self._ansi_buffer.shape != (height, width * cell_len + len(self._ROW_END))):
+            self._allocate_ansi_buffers(height, width)
+        
+        # Per-cell views into the row buffers
+        cells = self._ansi_buffer[:, :width * cell_len].reshape(height, width, cell_len)
+        keep = self._ansi_mask[:, :width * cell_len].reshape(height, width, cell_len)
+        
+        # Look up the digits of all color fields in one gather
+        num_fields = self._num_color_fields
+        lut_indices = values + self._channel_offsets
+        color_fields = cells[..., self._color_fields].reshape(height, width, num_fields, 4)
+        color_keep = keep[..., self._color_fields].reshape(height, width, num_fields, 4)
+        color_fields[...] = np.take(self._digit_lut, lut_indices, axis=0)
+        color_keep[...] = np.take(self._digit_keep, lut_indices, axis=0)
+        
+        # Only emit a color escape where the color differs from the previous
+        # cell in the row, so runs of equal color share a single escape. The
+        # fields are compared one at a time into a reused mask, which is much
+        # cheaper than reducing a (height, width, fields) comparison with np.any
+        changed = self._color_changed
+        np.not_equal(values[:, 1:, 0], values[:, :-1, 0], out=changed[:, 1:])
+        for field in range(1, num_fields):
+            np.not_equal(values[:, 1:, field], values[:, :-1, field], out=self._field_changed)
+            changed[:, 1:] |= self._field_changed
+        keep[..., :self._color_fields.start] = changed[..., None]
+        color_keep &= changed[..., None, None]
+        
+        # Character bytes fill the rest of each cell
+        char_start = len(self._cell_prefix)
+        cells[..., char_start:] = np.take(self._char_bytes_lut, intensity, axis=0)
+        if not self._fixed_width_chars:
+            keep[..., char_start:] = np.take(self._char_bytes_keep, intensity, axis=0)
+        
+        return self._ansi_buffer[self._ansi_mask].tobytes()
+    
+    def convert_frame_ansi(self, frame: np.ndarray) -> bytes:
+        """Convert a video frame to colored ASCII art ready to write to a terminal.
+        
+        Args:
+            frame: BGR image as numpy array
+        
+        Returns:
+            UTF-8 encoded bytes with ANSI color codes, one row per line
+        """
+        # Resize, map intensities to characters and colors, and render the
+        # ANSI codes with the function specialized for these settings
+        return self._fast(frame)
     
     def convert_frame(self, frame: np.ndarray) -> str:
         """Convert a video frame to colored ASCII art.
@@ -266,14 +592,4 @@ class ASCIIConverter:
         Returns:
             String with ANSI color codes for the ASCII art
         """
-        # Resize frame to target dimensions
-        resized = self._resize_frame(frame)
-        
-        # Convert to grayscale for character mapping
-        gray = self._frame_to_grayscale(resized)
-        
-        # Map intensities to ASCII characters
-        ascii_chars = self._map_intensity_to_chars(gray)
-        
-        # Create colored text with ANSI codes
-        return self._create_ansi_text(resized, ascii_chars) 
\ No newline at end of file
+        return self.convert_frame_ansi(frame).decode('utf-8')
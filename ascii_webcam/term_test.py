@@ -15,6 +15,9 @@ from rich.text import Text
 import click
 
 class TerminalTest:
+    # Seconds between terminal size checks
+    SIZE_CHECK_INTERVAL = 1.0
+    
     def __init__(self):
         """Initialize the terminal test application."""
         # Initialize Rich console with default settings
@@ -108,12 +111,23 @@ class TerminalTest:
             input_thread = threading.Thread(target=self.input_listener, daemon=True)
             input_thread.start()
             
+            last_size = None
+            last_size_check = 0.0
             while self.running:
-                # Clear screen and move cursor to top-left
-                self.console.clear()
-                
-                # Display updated terminal info with layout
-                self.display_terminal_info()
+                # Poll the terminal size periodically and only redraw the
+                # layout when it has actually changed
+                current_time = time.time()
+                if current_time - last_size_check >= self.SIZE_CHECK_INTERVAL:
+                    last_size_check = current_time
+                    size = self.get_terminal_size()
+                    if size != last_size:
+                        last_size = size
+                        
+                        # Clear screen and move cursor to top-left
+                        self.console.clear()
+                        
+                        # Display updated terminal info with layout
+                        self.display_terminal_info()
                 
                 # Brief pause to prevent high CPU usage
                 time.sleep(0.1)
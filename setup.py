@@ -18,6 +18,9 @@ setup(
         "rich>=13.9.4",
     ],
     extras_require={
+        "fast": [
+            "numba>=0.59.0",
+        ],
         "dev": [
             "pytest>=8.0.0",
             "pytest-cov>=4.1.0",
@@ -0,0 +1,170 @@
+"""Unit tests for the ASCII Webcam application."""
+import threading
+import cv2
+import pytest
+from ascii_webcam.app import ASCIIWebcam, CameraError
+
+@pytest.fixture
+def app(mock_webcam):
+    """Create an application wired to the mock webcam."""
+    app = ASCIIWebcam()
+    app.cap = mock_webcam
+    yield app
+    app.cleanup()
+
+def test_print_display_writes_frame(app, capsysbinary):
+    """Test a full screen is written starting from the home position."""
+    app.print_display()
+    out = capsysbinary.readouterr().out
+    
+    assert app.error_message is None
+    assert out.startswith(b"\033[H")
+    assert b"\033[38;2;" in out
+    assert b"Target FPS: 15.0" in out
+    assert app.frame_num == 1
+
+def test_print_display_reuses_output_buffer(app, mock_webcam, capsysbinary):
+    """Test consecutive frames are assembled in the same screen buffer."""
+    frame = mock_webcam.read.return_value[1]
+    mock_webcam.read.side_effect = [(True, frame), (True, 255 - frame)]
+    buffer = app._output_buffer
+    app.print_display()
+    app.print_display()
+    
+    assert app._output_buffer is buffer
+    assert capsysbinary.readouterr().out.count(b"\033[H") == 2
+
+def test_print_display_skips_unchanged_screen(app, capsysbinary):
+    """Test an identical frame with the same status line is not written again."""
+    app.print_display()
+    app.print_display()
+    assert capsysbinary.readouterr().out.count(b"\033[H") == 1
+    assert app.frame_num == 2
+    
+    # A changed status line redraws the screen
+    app.toggle_help()
+    app.print_display()
+    assert capsysbinary.readouterr().out.startswith(b"\033[H")
+
+def test_noise_threshold_skips_redrawing(mock_webcam, capsysbinary):
+    """Test a frame within the noise threshold leaves the screen alone."""
+    app = ASCIIWebcam(noise_threshold=8)
+    app.cap = mock_webcam
+    app.show_status = False
+    frame = mock_webcam.read.return_value[1]
+    mock_webcam.read.side_effect = [(True, frame), (True, frame + 8), (True, frame + 9)]
+    try:
+        for _ in range(3):
+            app.print_display()
+        assert capsysbinary.readouterr().out.count(b"\033[H") == 2
+    finally:
+        app.cleanup()
+
+def test_configure_capture_requests_small_frames(app, mock_webcam):
+    """Test the camera is asked for frames near the terminal resolution."""
+    app.configure_capture()
+    
+    requested = {call.args[0]: call.args[1] for call in mock_webcam.set.call_args_list}
+    assert requested[cv2.CAP_PROP_FRAME_WIDTH] == app.converter.width * app.CAPTURE_SUPERSAMPLE
+    assert requested[cv2.CAP_PROP_FRAME_HEIGHT] > app.converter.height * app.CAPTURE_SUPERSAMPLE
+    assert requested[cv2.CAP_PROP_FOURCC] == cv2.VideoWriter_fourcc(*'MJPG')
+    assert requested[cv2.CAP_PROP_BUFFERSIZE] == 1
+
+def test_capture_thread_delivers_frames(app, mock_webcam):
+    """Test frames are taken from the background capture thread."""
+    app.start_capture()
+    try:
+        frame = app.capture_frame()
+        assert frame is mock_webcam.read.return_value[1]
+    finally:
+        app.stop_capture()
+    assert app._capture_thread is None
+
+def test_capture_thread_reports_failures(app, mock_webcam):
+    """Test a failing camera surfaces as a CameraError."""
+    mock_webcam.read.return_value = (False, None)
+    app.start_capture()
+    try:
+        with pytest.raises(CameraError):
+            app.capture_frame()
+    finally:
+        app.stop_capture()
+    assert app.error_message is not None
+
+def test_stuck_capture_thread_is_not_replaced(app, mock_webcam, monkeypatch):
+    """Test a thread blocked in a read keeps the device until it returns."""
+    monkeypatch.setattr(app, 'CAPTURE_TIMEOUT', 0.01)
+    reading = threading.Event()
+    unblock = threading.Event()
+    frame = mock_webcam.read.return_value
+    
+    def blocking_read():
+        reading.set()
+        unblock.wait()
+        return frame
+    
+    mock_webcam.read.side_effect = blocking_read
+    app.start_capture()
+    thread = app._capture_thread
+    try:
+        assert reading.wait(timeout=1.0)
+        app._needs_resize = True
+        mock_webcam.set.reset_mock()
+        app.handle_resize_update()
+        
+        # The device is not reconfigured and no second thread is started
+        assert app._needs_resize
+        mock_webcam.set.assert_not_called()
+        assert app._capture_thread is thread
+        with pytest.raises(CameraError):
+            app.start_capture()
+    finally:
+        unblock.set()
+    
+    thread.join(timeout=1.0)
+    assert app.stop_capture()
+    assert app._capture_thread is None
+
+def test_actual_fps_uses_rolling_window(app, monkeypatch):
+    """Test that the running FPS stat matches the mean of the window."""
+    app.last_frame_time = 100.0
+    for i in range(1, 41):
+        monkeypatch.setattr('ascii_webcam.app.time.time', lambda i=i: 100.0 + 0.05 * i)
+        app.update_performance_stats()
+    
+    assert app._ft_count == len(app.frame_times)
+    assert app.actual_fps == pytest.approx(20.0)
+
+def test_usage_stats_sampled_on_interval(app, monkeypatch):
+    """Test CPU and memory usage are sampled by wall time, not per frame."""
+    monkeypatch.setattr(app.process, 'cpu_percent', lambda: 42.0)
+    for i in range(60):
+        monkeypatch.setattr('ascii_webcam.app.time.time', lambda i=i: 1000.0 + 0.01 * i)
+        app.update_performance_stats()
+        if i == 0:
+            assert app.cpu_usage == 42.0
+            app.cpu_usage = 0.0
+    
+    assert app.cpu_usage == 0.0
+
+def test_handle_keyboard_waits_for_timeout(app, monkeypatch):
+    """Test the keyboard poll blocks in select for the given timeout."""
+    calls = []
+    monkeypatch.setattr('ascii_webcam.app.select.select',
+                        lambda r, w, x, timeout: calls.append(timeout) or ([], [], []))
+    
+    assert app.handle_keyboard(0.05) is True
+    assert calls == [0.05]
+
+def test_status_line_refreshes_on_interval(app, monkeypatch):
+    """Test the status line is cached between refreshes but follows settings."""
+    monkeypatch.setattr('ascii_webcam.app.time.time', lambda: 1000.0)
+    first = app.status_line(200, 40, 0.002)
+    app.actual_fps = 99.0
+    assert app.status_line(200, 40, 0.002) is first
+    
+    app.frame_rate = 5.0
+    assert b"Target FPS: 5.0" in app.status_line(200, 40, 0.002)
+    
+    monkeypatch.setattr('ascii_webcam.app.time.time', lambda: 1000.0 + app.STATUS_INTERVAL)
+    assert b"Actual FPS: 99.0" in app.status_line(200, 40, 0.002)
@@ -1,6 +1,7 @@
 """Unit tests for the ASCII converter module."""
 import pytest
 import numpy as np
+from ascii_webcam.app import ASCIIWebcam
 from ascii_webcam.converter import ASCIIConverter
 
 def test_converter_init():
@@ -16,6 +17,11 @@ def test_converter_init_invalid_preset():
     with pytest.raises(ValueError, match="Unknown preset"):
         ASCIIConverter(preset='invalid')
 
+def test_converter_init_invalid_palette():
+    """Test converter initialization with invalid palette."""
+    with pytest.raises(ValueError, match="Unknown palette"):
+        ASCIIConverter(palette='invalid')
+
 def test_converter_init_invalid_color_scheme():
     """Test converter initialization with invalid color scheme."""
     with pytest.raises(ValueError, match="Unknown color scheme"):
@@ -106,16 +112,193 @@ def test_color_buffer_resize():
     assert shape1 != shape2
     assert result2.shape == frame2.shape
 
-def test_type_safety():
+def test_true_scheme_skips_color_buffer():
+    """Test the true scheme renders without allocating a color buffer."""
+    frame = np.random.default_rng(0).integers(0, 256, (30, 40, 3), dtype=np.uint8)
+    converter = ASCIIConverter(width=20)
+    converter.convert_frame_ansi(frame)
+    assert converter._color_buffer is None
+    
+    converter = ASCIIConverter(width=20, color_scheme='neon')
+    converter.convert_frame_ansi(frame)
+    assert converter._color_buffer.shape == converter._resized_buffer.shape
+
+@pytest.mark.parametrize('scheme', ASCIIConverter.available_color_schemes())
+def test_type_safety(scheme):
     """Test type safety in color processing."""
-    converter = ASCIIConverter()
+    converter = ASCIIConverter(color_scheme=scheme)
     
     # Test with different input types
-    frame_uint8 = np.zeros((10, 10, 3), dtype=np.uint8)
-    frame_float = np.zeros((10, 10, 3), dtype=np.float32)
+    frame_uint8 = np.random.default_rng(0).integers(0, 256, (10, 10, 3), dtype=np.uint8)
+    frame_float = frame_uint8.astype(np.float32)
     
-    result_uint8 = converter._color_func_vec(frame_uint8)
+    # Separate converters, so a stale buffer cannot pass for a result
+    result_uint8 = ASCIIConverter(color_scheme=scheme)._color_func_vec(frame_uint8)
     result_float = converter._color_func_vec(frame_float)
     
     assert result_uint8.dtype == np.uint8
-    assert result_float.dtype == np.uint8  # Should convert to uint8 
\ No newline at end of file
+    assert result_float.dtype == np.uint8  # Should convert to uint8 
+    np.testing.assert_array_equal(result_float, result_uint8)
+
+def test_convert_frame_ansi_output():
+    """Test the exact ANSI layout of a converted frame."""
+    converter = ASCIIConverter(preset='matrix', width=10)
+    frame = np.zeros((5, 10, 3), dtype=np.uint8)
+    frame[0, 0] = [255, 255, 255]  # White pixel in the top-left corner
+    
+    lines = converter.convert_frame(frame).split('\n')
+    assert len(lines) == 5
+    assert lines[0].startswith("\033[38;2;255;255;255m1\033[38;2;0;0;0m0")
+    assert lines[4] == "\033[38;2;0;0;0m" + "0" * 10 + "\033[0m"
+
+def test_convert_frame_coalesces_color_runs():
+    """Test a color escape is only emitted where the color changes."""
+    converter = ASCIIConverter(preset='matrix', width=10)
+    frame = np.zeros((5, 10, 3), dtype=np.uint8)
+    frame[:, 5:] = [0, 0, 255]  # Right half red
+    
+    lines = converter.convert_frame(frame).split('\n')
+    for line in lines:
+        assert line == "\033[38;2;0;0;0m00000\033[38;2;255;0;0m00000\033[0m"
+
+@pytest.mark.parametrize('palette, red_escape', [('truecolor', "38;2;255;0;0m"), ('256', "38;5;196m")])
+@pytest.mark.parametrize('scheme', ['true', 'neon'])
+def test_convert_frame_keeps_red_red(scheme, palette, red_escape):
+    """Test BGR frames are emitted in RGB order for every scheme and palette."""
+    converter = ASCIIConverter(preset='matrix', width=10, color_scheme=scheme, palette=palette)
+    frame = np.zeros((5, 10, 3), dtype=np.uint8)
+    frame[..., 2] = 255  # Pure red in BGR
+    
+    assert converter.convert_frame(frame).startswith("\033[" + red_escape)
+
+def test_map_intensity_to_chars_lut():
+    """Test the intensity lookup table covers the full character range."""
+    converter = ASCIIConverter(preset='classic')
+    intensity = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    chars = converter._map_intensity_to_chars(intensity)
+    
+    assert chars.shape == intensity.shape
+    assert chars[0, 0] == converter.chars[0]     # Black maps to darkest char
+    assert chars[-1, -1] == converter.chars[-1]  # White maps to lightest char
+    assert set(chars.ravel()) == set(converter.chars)
+
+@pytest.mark.parametrize('scheme', ['neon', 'matrix', 'vintage', 'cyberpunk'])
+def test_color_func_matches_scheme_definition(scheme, test_frame):
+    """Test the optimized color path agrees with the COLOR_SCHEMES definition."""
+    converter = ASCIIConverter(color_scheme=scheme)
+    result = converter._color_func_vec(test_frame).astype(np.int16)
+    
+    b, g, r = (test_frame[..., i].astype(np.float32) for i in range(3))
+    r_out, g_out, b_out = ASCIIConverter.COLOR_SCHEMES[scheme](b, g, r)
+    expected = np.stack([b_out, g_out, r_out], axis=-1)
+    
+    # OpenCV rounds where a plain cast would truncate
+    assert np.all(np.abs(result - expected) <= 1)
+
+def test_convert_frame_256_palette():
+    """Test the 256-color palette emits xterm color cube indices."""
+    converter = ASCIIConverter(preset='matrix', width=10, palette='256')
+    frame = np.zeros((5, 10, 3), dtype=np.uint8)
+    frame[:, 5:] = [0, 0, 255]  # Right half red
+    frame[0, 0] = [255, 255, 255]  # White pixel in the top-left corner
+    
+    lines = converter.convert_frame(frame).split('\n')
+    assert lines[0] == "\033[38;5;231m1\033[38;5;16m0000\033[38;5;196m00000\033[0m"
+    assert lines[1] == "\033[38;5;16m00000\033[38;5;196m00000\033[0m"
+
+@pytest.mark.parametrize('palette', list(ASCIIConverter.PALETTES))
+@pytest.mark.parametrize('preset', ['classic', 'dense_blocks', 'braille'])
+def test_compiled_renderer_matches_vectorized(preset, palette):
+    """Test the Numba kernel produces the same bytes as the NumPy renderer."""
+    pytest.importorskip('numba')
+    converter = ASCIIConverter(preset=preset, palette=palette)
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 4, (12, 20, converter._num_color_fields), dtype=np.uint8) * 60
+    intensity = rng.integers(0, 256, (12, 20), dtype=np.uint8)
+    
+    assert (converter._render_compiled(values, intensity) ==
+            converter._render_vectorized(values, intensity))
+    # Reversed channel views, as used for BGR frames
+    assert (converter._render_compiled(values[..., ::-1], intensity) ==
+            converter._render_vectorized(values[..., ::-1], intensity))
+
+def test_resize_averages_sensor_noise_at_capture_size():
+    """Test noise at the app's capture resolution barely changes the cells."""
+    width, height = 157, 38
+    frame_size = (int(height * ASCIIWebcam.CAPTURE_SUPERSAMPLE / ASCIIConverter.CHAR_ASPECT),
+                  width * ASCIIWebcam.CAPTURE_SUPERSAMPLE)
+    rng = np.random.default_rng(0)
+    scene = rng.uniform(40, 215, (*frame_size, 3))
+    converter = ASCIIConverter(width=width, height=height)
+    
+    # Two captures of the same scene that differ by sensor noise only
+    resized = []
+    for _ in range(2):
+        frame = np.clip(scene + rng.normal(0, 3, scene.shape), 0, 255).astype(np.uint8)
+        resized.append(converter._resize_frame(frame).astype(int))
+    
+    assert resized[0].shape == (height, width, 3)
+    assert np.abs(resized[0] - resized[1]).max() <= 4
+
+def test_nonlinear_color_scheme_rejected(monkeypatch):
+    """Test schemes that no transform can reproduce fail loudly."""
+    schemes = dict(ASCIIConverter.COLOR_SCHEMES, gamma=lambda b, g, r: (r ** 0.5, g, b))
+    monkeypatch.setattr(ASCIIConverter, 'COLOR_SCHEMES', schemes)
+    with pytest.raises(ValueError, match="Color scheme 'gamma'"):
+        ASCIIConverter(color_scheme='gamma')
+
+def test_convert_frame_512_palette():
+    """Test the 512-color palette merges nearby colors into one run."""
+    converter = ASCIIConverter(preset='matrix', width=10, palette='512')
+    frame = np.zeros((5, 10, 3), dtype=np.uint8)
+    frame[:, :5] = [0, 0, 200]
+    frame[:, 5:] = [10, 0, 210]  # Same bucket as the left half
+    
+    lines = converter.convert_frame(frame).split('\n')
+    assert lines[0] == "\033[38;2;208;16;16m" + "0" * 10 + "\033[0m"
+
+def test_convert_frame_reuses_output_for_identical_frames():
+    """Test an unchanged frame returns the previous output without rendering."""
+    converter = ASCIIConverter(width=20)
+    frame = np.random.default_rng(0).integers(0, 256, (30, 40, 3), dtype=np.uint8)
+    first = converter.convert_frame_ansi(frame)
+    
+    # Rendering creates a new bytes object, so identity shows it was skipped
+    assert converter.convert_frame_ansi(frame.copy()) is first
+    assert converter.convert_frame_ansi(255 - frame) != first
+
+def test_reused_output_requires_matching_shape():
+    """Test frames with equal pixel bytes but different shapes are both rendered."""
+    converter = ASCIIConverter(width=20, height=10)
+    tall = converter.convert_frame_ansi(np.zeros((6, 10, 3), dtype=np.uint8))
+    wide = converter.convert_frame_ansi(np.zeros((5, 12, 3), dtype=np.uint8))
+    
+    assert tall.count(b"\n") == 5
+    assert wide.count(b"\n") == 4
+
+def test_noise_threshold_skips_small_changes():
+    """Test changes within the noise threshold keep the previous output."""
+    converter = ASCIIConverter(width=20, noise_threshold=8)
+    frame = np.random.default_rng(0).integers(64, 192, (30, 40, 3), dtype=np.uint8)
+    first = converter.convert_frame_ansi(frame)
+    
+    assert converter.convert_frame_ansi(frame + 8) is first
+    # Changes are measured against the rendered frame, so drift adds up
+    assert converter.convert_frame_ansi(frame + 9) == ASCIIConverter(width=20).convert_frame_ansi(frame + 9)
+    
+    with pytest.raises(ValueError, match="Invalid noise threshold"):
+        ASCIIConverter(noise_threshold=256)
+
+@pytest.mark.parametrize('palette', list(ASCIIConverter.PALETTES))
+def test_striped_renderer_matches_single_pass(palette):
+    """Test rendering row stripes in parallel gives the same bytes."""
+    pytest.importorskip('numba')
+    converter = ASCIIConverter(preset='blocks', palette=palette)
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 4, (13, 20, converter._num_color_fields), dtype=np.uint8) * 60
+    intensity = rng.integers(0, 256, (13, 20), dtype=np.uint8)
+    
+    converter._render_stripes = 1
+    expected = converter._render_compiled(values, intensity)
+    converter._render_stripes = 3
+    assert converter._render_compiled(values, intensity) == expected